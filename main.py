@@ -1,3 +1,6 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from src.data import download_data, load_movies
 from src.config import GOOGLE_FILE_ID, RAW_DIR
 from src.analysis import (
@@ -12,6 +15,10 @@ from src.analysis import (
     release_year_extrema,
     best_reputation_directors,
     actor_rankings,
+    categorize_columns,
+    detect_columns,
+    downcast_numeric,
+    project_columns,
 )
 
 def main():
@@ -30,8 +37,35 @@ def main():
     print(f"Loaded {len(df):,} rows from: {table_path}")
     print("=" * 72)
 
+    # Resolve column names once, keep only the columns the questions read,
+    # store the grouping keys as categories and narrow the numeric metrics;
+    # every question below reuses `cols`
+    cols = detect_columns(df)
+    df = project_columns(df, cols)
+    df = categorize_columns(df, cols)
+    df = downcast_numeric(df, cols)
+
+    # The questions only read df, so run them concurrently (pandas/Arrow kernels
+    # release the GIL) and print the results in order below
+    tasks = {
+        "Q1": (count_bw_color, {}),
+        "Q2": (movies_per_director, {}),
+        "Q3": (ten_least_criticized, {}),
+        "Q4": (twenty_longest_running, {}),
+        "Q5": (top5_gross_highest, {}),
+        "Q6": (top5_gross_lowest, {}),
+        "Q7": (top3_budget_highest, {}),
+        "Q8": (top3_budget_lowest, {}),
+        "Q9": (release_year_extrema, {}),
+        "Q10": (best_reputation_directors, {"top": 5, "min_movies": 3}),
+        "Q11": (actor_rankings, {"top": 10}),
+    }
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+        futures = {q: ex.submit(fn, df, cols=cols, **kw) for q, (fn, kw) in tasks.items()}
+    results = {q: f.result() for q, f in futures.items()}
+
     # Q1
-    counts, color_col = count_bw_color(df)
+    counts, color_col = results["Q1"]
     print("\n[Q1] How many Black & White and Color movies are in the list?")
     print(f"Detected color column: {color_col}")
     print(f"  Color:         {counts.get('Color', 0):,}")
@@ -39,7 +73,7 @@ def main():
     print(f"  Unknown:       {counts.get('Unknown', 0):,}")
 
     # Q2
-    counts_df, director_col = movies_per_director(df)
+    counts_df, director_col = results["Q2"]
     print("\n[Q2] How many movies were produced by director in the list?")
     if director_col is None or counts_df.empty:
         print("  Could not find a 'director' column.")
@@ -51,7 +85,7 @@ def main():
             print(f"    {row['director']}: {int(row['movie_count'])}")
 
     # Q3
-    least_df, count_col, title_col = ten_least_criticized(df)
+    least_df, count_col, title_col = results["Q3"]
     print("\n[Q3] Which are the 10 less criticized movies in the list?")
     if count_col is None or least_df.empty:
         print("  Could not find a suitable 'critic reviews / reviews / votes' column.")
@@ -61,7 +95,7 @@ def main():
             print(f"    {row['title']}  — {int(row['criticized_count'])}")
 
     # Q4
-    long_df, runtime_col, title_col2 = twenty_longest_running(df)
+    long_df, runtime_col, title_col2 = results["Q4"]
     print("\n[Q4] Which are the 20 longest-running movies in the list?")
     if runtime_col is None or long_df.empty:
         print("  Could not find a suitable 'runtime/duration' column.")
@@ -71,7 +105,7 @@ def main():
             print(f"    {row['title']}  — {row['runtime_min']:.0f} min")
 
     # Q5
-    top_gross_df, gross_col, tcol = top5_gross_highest(df)
+    top_gross_df, gross_col, tcol = results["Q5"]
     print("\n[Q5] Top 5 movies that raised more money (highest gross):")
     if gross_col is None or top_gross_df.empty:
         print("  Could not find a 'gross/revenue/box office' column.")
@@ -81,7 +115,7 @@ def main():
             print(f"    {row['title']}  — {int(row['value']):,}")
 
     # Q6
-    low_gross_df, gross_col2, _ = top5_gross_lowest(df)
+    low_gross_df, gross_col2, _ = results["Q6"]
     print("\n[Q6] Top 5 movies that made the least money:")
     if gross_col2 is None or low_gross_df.empty:
         print("  Could not find a 'gross/revenue/box office' column.")
@@ -91,7 +125,7 @@ def main():
             print(f"    {row['title']}  — {int(row['value']):,}")
 
     # Q7
-    budget_hi_df, budget_col_hi, _ = top3_budget_highest(df)
+    budget_hi_df, budget_col_hi, _ = results["Q7"]
     print("\n[Q7] Top 3 movies that cost more to produce (highest budget):")
     if budget_col_hi is None or budget_hi_df.empty:
         print("  Could not find a 'budget' column.")
@@ -101,7 +135,7 @@ def main():
             print(f"    {row['title']}  — {int(row['value']):,}")
 
     # Q8
-    budget_lo_df, budget_col_lo, _ = top3_budget_lowest(df)
+    budget_lo_df, budget_col_lo, _ = results["Q8"]
     print("\n[Q8] Top 3 movies that cost less to produce (lowest budget):")
     if budget_col_lo is None or budget_lo_df.empty:
         print("  Could not find a 'budget' column.")
@@ -111,7 +145,7 @@ def main():
             print(f"    {row['title']}  — {int(row['value']):,}")
 
     # Q9
-    most_year, most_cnt, least_year, least_cnt, year_col = release_year_extrema(df)
+    most_year, most_cnt, least_year, least_cnt, year_col = results["Q9"]
     print("\n[Q9] Year with more movies released / year with less movies released:")
     if year_col is None:
         print("  Could not find a 'year' column.")
@@ -123,7 +157,7 @@ def main():
             print(f"  Least releases: {least_year} — {least_cnt:,} movies")
 
     # Q10
-    rep_df, dir_col, rating_col = best_reputation_directors(df, top=5, min_movies=3)
+    rep_df, dir_col, rating_col = results["Q10"]
     print("\n[Q10] Top five best reputation directors (by average rating):")
     if dir_col is None or rating_col is None or rep_df.empty:
         print("  Could not compute (need director and rating columns).")
@@ -133,7 +167,7 @@ def main():
             print(f"    {r['director']}: {r['avg_rating']:.2f} (over {int(r['movies'])} movies)")
 
     # Q11 (actor rankings)
-    by_perf, by_social, best, name_cols, a_rating_col = actor_rankings(df, top=10)
+    by_perf, by_social, best, name_cols, a_rating_col = results["Q11"]
     print("\n[Q11] Actor ranking")
     if not name_cols:
         print("  Could not find actor name columns.")
@@ -1,268 +1,409 @@
 import re
-from typing import Optional, Tuple, List
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .colors import COLOR_LABELS, standardize_colors
+
+# ----------------- column patterns -----------------
+def _compile(*patterns: str) -> Tuple["re.Pattern", ...]:
+    return tuple(re.compile(p, re.I) for p in patterns)
+
+_TITLE_PATS = _compile(r"^title$", r"movie[_\s]?title", r"\btitle\b", r"movie", r"name$")
+_COLOR_PATS = _compile(r"\bcolor\b", r"b(?:lack)?.*white", r"b&w")
+_DIRECTOR_PATS = _compile(r"director")
+_CRITIC_PATS = _compile(r"critic.*review", r"num.*critic", r"reviews? \(critic\)", r"critic_reviews", r"metacritic.*reviews")
+_REVIEW_PATS = _compile(r"\breviews?\b", r"review_count", r"num_reviews")
+_VOTE_PATS = _compile(r"\bvotes?\b", r"imdb.*votes", r"user.*votes")
+_RUNTIME_PATS = _compile(r"runtime", r"duration", r"length", r"running.?time", r"mins?", r"minutes?", r"time$")
+_GROSS_PATS = _compile(r"\bgross\b", r"revenue", r"box.?office", r"world.*gross", r"domestic.*gross")
+_BUDGET_PATS = _compile(r"\bbudget\b", r"production.*budget", r"cost")
+_YEAR_PATS = _compile(r"\btitle[_\s]?year\b", r"release.*year", r"\byear\b")
+_RATING_PATS = _compile(r"imdb.*score", r"\brating\b", r"\bscore\b", r"metascore", r"metacritic", r"tomato.*meter")
+_ACTOR_RATING_PATS = _compile(r"imdb.*score", r"\brating\b", r"\bscore\b")
+
+_ACTOR_NAME_RE = re.compile(r"\bactor.*name\b|\bstar.*name\b|\bcast.*name\b", re.I)
+_ACTOR_SLOT_RE = re.compile(r"actor[_\s]*([0-9]+).*name", re.I)
+_LIKES_RE = re.compile(r"facebook.*likes", re.I)
 
 # ----------------- generic helpers -----------------
-def _find_col(df: pd.DataFrame, patterns: List[str]) -> Optional[str]:
-    """Pick the column whose name matches any regex in patterns, preferring the least-null one."""
-    pats = [re.compile(p, re.I) for p in patterns]
-    cands = [c for c in df.columns if any(p.search(str(c)) for p in pats)]
+def _find_col(df: pd.DataFrame, patterns: Tuple["re.Pattern", ...]) -> Optional[str]:
+    """Pick the column whose name matches any precompiled regex in patterns, preferring the least-null one."""
+    cands = [c for c in df.columns if any(p.search(str(c)) for p in patterns)]
     if not cands:
         return None
     return max(cands, key=lambda c: df[c].notna().sum())
 
 def _title_col(df: pd.DataFrame) -> str:
-    return _find_col(df, [r"^title$", r"movie[_\s]?title", r"\btitle\b", r"movie", r"name$"]) or df.columns[0]
+    return _find_col(df, _TITLE_PATS) or df.columns[0]
+
+def _flat_columns(cols: Dict) -> set:
+    out = set()
+    for v in cols.values():
+        out.update(v if isinstance(v, list) else [v])
+    out.discard(None)
+    return out
+
+def _detect_columns(df: pd.DataFrame) -> Dict[str, object]:
+    """Resolve every column Q1-Q11 read in one pass (no caching)."""
+    name_cols, likes_cols = _actor_columns(df)
+    return {
+        "title": _title_col(df),
+        "color": _infer_color_column(df),
+        "director": _find_col(df, _DIRECTOR_PATS),
+        "critic_count": _find_col(df, _CRITIC_PATS) or _find_col(df, _REVIEW_PATS) or _find_col(df, _VOTE_PATS),
+        "runtime": _find_col(df, _RUNTIME_PATS),
+        "gross": _find_col(df, _GROSS_PATS),
+        "budget": _find_col(df, _BUDGET_PATS),
+        "year": _find_col(df, _YEAR_PATS),
+        "rating": _find_col(df, _RATING_PATS),
+        "actor_rating": _find_col(df, _ACTOR_RATING_PATS),
+        "actors": name_cols,
+        "actor_likes": likes_cols,
+    }
+
+def detect_columns(df: pd.DataFrame) -> Dict[str, object]:
+    """
+    Resolve every column Q1-Q11 read; pass the result as cols= to skip re-detection.
+    The result is kept in df.attrs["_col_index"] and reused only for this same object with the
+    same columns (frames derived from df inherit attrs but are re-detected). Changing values in
+    place is not tracked, so call it after the frame is final. The question functions never
+    touch attrs: without cols= they detect afresh.
+    """
+    key = (id(df), tuple(df.columns))
+    cached = df.attrs.get("_col_index")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    cols = _detect_columns(df)
+    df.attrs["_col_index"] = (key, cols)
+    return cols
+
+def project_columns(df: pd.DataFrame, cols: Optional[Dict] = None) -> pd.DataFrame:
+    """Restrict df to the columns Q1-Q11 actually read, so per-question copies stay narrow."""
+    keep = _flat_columns(_detect_columns(df) if cols is None else cols)
+    return df[[c for c in df.columns if c in keep]]
+
+def categorize_columns(df: pd.DataFrame, cols: Optional[Dict] = None) -> pd.DataFrame:
+    """Store the director, color and actor-name columns as category so grouping runs on integer codes.
+
+    Q11 reads the actor codes and categories directly instead of factorizing the names again."""
+    cols = _detect_columns(df) if cols is None else cols
+    # fully empty columns (null[pyarrow] after an Arrow-backed load) have no categories to build
+    cats = [c for c in dict.fromkeys([cols["director"], cols["color"]] + cols["actors"])
+            if c is not None and not isinstance(df[c].dtype, pd.CategoricalDtype) and df[c].count() > 0]
+    return df.astype({c: "category" for c in cats}) if cats else df
+
+def downcast_numeric(df: pd.DataFrame, cols: Optional[Dict] = None) -> pd.DataFrame:
+    """Store the numeric metric columns in the narrowest int/float dtype pandas downcasts them to.
+
+    Whole-number columns without gaps become ints; the rest may become float32, which keeps only
+    ~7 significant digits (an imdb_score of 6.7 is stored as 6.6999998)."""
+    cols = _detect_columns(df) if cols is None else cols
+    metrics = [cols[k] for k in ("critic_count", "runtime", "gross", "budget", "year", "rating", "actor_rating")]
+    out = {}
+    for c in dict.fromkeys(metrics + cols["actor_likes"]):
+        if c is None or not pd.api.types.is_numeric_dtype(df[c]) or pd.api.types.is_bool_dtype(df[c]):
+            continue
+        s = df[c]
+        # integer only for gap-free whole numbers (casting NaN warns), then float32 (kept only
+        # when pandas finds the values representable)
+        v = s.to_numpy(dtype=float, na_value=np.nan)
+        if pd.api.types.is_integer_dtype(s) or bool(np.all(v == np.trunc(v))):
+            small = pd.to_numeric(s, downcast="integer")
+        else:
+            small = s
+        if small.dtype == s.dtype:
+            small = pd.to_numeric(s, downcast="float")
+        if small.dtype != s.dtype:
+            out[c] = small
+    return df.assign(**out) if out else df
 
 def _to_numeric(s: pd.Series) -> pd.Series:
     return pd.to_numeric(s, errors="coerce")
 
 # ----------------- Q1: Color vs Black & White -----------------
 def _infer_color_column(df: pd.DataFrame) -> Optional[str]:
-    return _find_col(df, [r"\bcolor\b", r"b(?:lack)?.*white", r"b&w"])
-
-def _standardize_color_series(df: pd.DataFrame, col: str) -> pd.Series:
-    # string ops must use .str.<method>
-    s = df[col].astype(str).str.strip().str.lower()
-
-    def map_value(x: str) -> str:
-        if x in ("", "nan", "none", "null"):
-            return "Unknown"
-        if "black" in x and "white" in x:
-            return "Black & White"
-        if "b&w" in x or "b/w" in x or x == "bw":
-            return "Black & White"
-        if "mono" in x or "grayscale" in x or "greyscale" in x:
-            return "Black & White"
-        if "color" in x or "colour" in x or "colorized" in x:
-            return "Color"
-        return "Unknown"
-
-    return s.map(map_value)
-
-def count_bw_color(df: pd.DataFrame):
+    return _find_col(df, _COLOR_PATS)
+
+def _standardize_colors_by_category(df: pd.DataFrame, col: str) -> pd.Series:
+    """Classify colors with colors.standardize_colors, once per category for categorical columns."""
+    if not isinstance(df[col].dtype, pd.CategoricalDtype):
+        return standardize_colors(df, col)
+    # classify each distinct value once, then broadcast through the integer codes;
+    # a trailing Unknown slot catches the -1 (missing) codes, also when there are no categories
+    cats = standardize_colors(pd.DataFrame({col: df[col].cat.categories}), col)
+    lookup = np.append(cats.cat.codes.to_numpy(), COLOR_LABELS.index("Unknown"))
+    out = lookup[df[col].cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(out, categories=COLOR_LABELS), index=df.index, name=col)
+
+def count_bw_color(df: pd.DataFrame, cols: Optional[Dict] = None):
     """Return (counts_dict, detected_color_column)."""
-    col = _infer_color_column(df)
+    col = (_detect_columns(df) if cols is None else cols)["color"]
     if col is None:
         return {"Black & White": 0, "Color": 0, "Unknown": len(df)}, None
-    mapped = _standardize_color_series(df, col)
-    counts = mapped.value_counts(dropna=False).to_dict()
-    for k in ["Black & White", "Color", "Unknown"]:
-        counts.setdefault(k, 0)
+    mapped = _standardize_colors_by_category(df, col)
+    # categorical value_counts reports every label, including zero counts
+    counts = {k: int(v) for k, v in mapped.value_counts().items()}
     return counts, col
 
 # ----------------- Q2: Movies per director -----------------
-def movies_per_director(df: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[str]]:
-    col = _find_col(df, [r"director"])
+def movies_per_director(df: pd.DataFrame, cols: Optional[Dict] = None) -> Tuple[pd.DataFrame, Optional[str]]:
+    col = (_detect_columns(df) if cols is None else cols)["director"]
     if col is None:
         return pd.DataFrame(columns=["director", "movie_count"]), None
-    s = df[col].dropna().astype(str)
-    s = s.str.replace(r"\s+and\s+", ",", regex=True).str.replace(r"[\/\|&;]", ",", regex=True)
-    exploded = s.str.split(",").explode().str.strip()
-    exploded = exploded[exploded != ""]
+    # replace/split/flatten/trim/filter all run as Arrow compute kernels
+    arr = df[col].dropna().astype("string[pyarrow]").array.__arrow_array__()
+    arr = pc.replace_substring_regex(arr, r"\s+and\s+|[/|&;]", ",")
+    names = pc.utf8_trim_whitespace(pc.list_flatten(pc.split_pattern(arr, ",")))
+    names = names.filter(pc.greater(pc.utf8_length(names), 0))
+    exploded = pd.Series(names, dtype=pd.ArrowDtype(pa.string()))
     counts = exploded.value_counts().rename_axis("director").reset_index(name="movie_count")
     return counts, col
 
 # ----------------- Q3: 10 least criticized movies -----------------
-def ten_least_criticized(df: pd.DataFrame):
-    title_col = _title_col(df)
-    count_col = _find_col(df, [
-        r"critic.*review", r"num.*critic", r"reviews? \(critic\)", r"critic_reviews", r"metacritic.*reviews"
-    ]) or _find_col(df, [r"\breviews?\b", r"review_count", r"num_reviews"]) \
-      or _find_col(df, [r"\bvotes?\b", r"imdb.*votes", r"user.*votes"])
+def ten_least_criticized(df: pd.DataFrame, cols: Optional[Dict] = None):
+    cols = _detect_columns(df) if cols is None else cols
+    title_col, count_col = cols["title"], cols["critic_count"]
     if count_col is None:
         return pd.DataFrame(columns=[title_col, "criticized_count"]), None, title_col
 
     counts = _to_numeric(df[count_col])
-    res = (df.assign(_count=counts)[[title_col, "_count"]]
-             .dropna(subset=["_count"])
-             .sort_values("_count", ascending=True)
-             .head(10)
-             .rename(columns={title_col: "title", "_count": "criticized_count"}))
+    # select on the metric alone (missing values dropped, nsmallest would pad with them),
+    # then gather just the n result rows
+    pos = counts.reset_index(drop=True).dropna().nsmallest(10).index
+    res = pd.DataFrame({"title": df[title_col].iloc[pos], "criticized_count": counts.iloc[pos]})
     return res, count_col, title_col
 
 # ----------------- Q4: 20 longest-running movies -----------------
-_RUNTIME_PATS = [r"runtime", r"duration", r"length", r"running.?time", r"mins?", r"minutes?", r"time$"]
-
-def _to_minutes(v) -> float:
-    if pd.isna(v): return np.nan
-    s = str(v).strip().lower()
+# '2h 30m' / '2 hours' (an optional bare minute count may follow the hours)
+_HOURS_RE = r"(?P<h>\d+(?:\.\d+)?)\s*h(?:ours?|rs?)?\s*(?P<hm>\d+)?"
+# '150 min' / '150m' / '30 minutes'
+_MINUTES_RE = r"(?P<m>\d+(?:\.\d+)?)\s*m(?:in(?:ute)?s?)?\b"
+# '1:45' or '02:30:00'
+_CLOCK_RE = r"^(?P<ch>\d+):(?P<cm>\d+)(?::\d+)?$"
+
+def _to_minutes(s: pd.Series) -> pd.Series:
+    """Vectorized runtime parser: returns float minutes aligned on s.index (NaN when unparseable)."""
+    if pd.api.types.is_numeric_dtype(s):
+        num = s.astype(float)
+        return num.where(num > 0)
+    s = s.astype("string").str.strip().str.lower()
     # number directly in minutes
-    try:
-        f = float(s)
-        if f > 0:
-            return f
-    except ValueError:
-        pass
-    # '150 min' / '150m'
-    m = re.search(r"(\d+(\.\d+)?)\s*(mins?|minutes?|m)\b", s)
-    if m:
-        return float(m.group(1))
-    # '2h 30m'
-    hm = re.search(r"(\d+)\s*h(?:ours?)?\s*(\d+)?\s*(m|mins?|minutes?)?", s)
-    if hm:
-        h = float(hm.group(1)); mm = float(hm.group(2) or 0)
-        return h * 60 + mm
-    # '1:45' or '02:30:00'
-    if ":" in s:
-        parts = s.split(":")
-        try:
-            nums = [float(p) for p in parts]
-        except ValueError:
-            nums = [0.0] * len(parts)
-        if len(nums) == 3:   # hh:mm:ss
-            return nums[0] * 60 + nums[1]
-        if len(nums) == 2:   # hh:mm
-            return nums[0] * 60 + nums[1]
-    return np.nan
-
-def twenty_longest_running(df: pd.DataFrame):
-    title_col = _title_col(df)
-    runtime_col = _find_col(df, _RUNTIME_PATS)
+    minutes = _to_numeric(s).astype(float)
+    minutes = minutes.where(minutes > 0).to_numpy(dtype=float, copy=True)
+
+    # only rows the plain-number pass missed go through the unit regexes
+    miss = np.isnan(minutes) & s.notna().to_numpy()
+    if miss.any():
+        rest = s[miss]
+        hours = rest.str.extract(_HOURS_RE, expand=True)
+        mins = _to_numeric(rest.str.extract(_MINUTES_RE, expand=True)["m"])
+        mins = mins.fillna(_to_numeric(hours["hm"]))
+        h_total = _to_numeric(hours["h"]) * 60 + mins.fillna(0)
+        minutes[miss] = h_total.fillna(mins).astype(float).to_numpy()
+
+    # and only what is still unparsed is tried as a clock value
+    miss &= np.isnan(minutes)
+    if miss.any():
+        clock = s[miss].str.extract(_CLOCK_RE, expand=True)
+        c_total = _to_numeric(clock["ch"]) * 60 + _to_numeric(clock["cm"])
+        minutes[miss] = c_total.astype(float).to_numpy()
+
+    return pd.Series(minutes, index=s.index, dtype=float)
+
+def twenty_longest_running(df: pd.DataFrame, cols: Optional[Dict] = None):
+    cols = _detect_columns(df) if cols is None else cols
+    title_col, runtime_col = cols["title"], cols["runtime"]
     if runtime_col is None:
         return pd.DataFrame(columns=[title_col, "runtime_min"]), None, title_col
-    minutes = df[runtime_col].map(_to_minutes)
-    res = (df.assign(_runtime_min=minutes)[[title_col, "_runtime_min"]]
-             .dropna(subset=["_runtime_min"])
-             .sort_values("_runtime_min", ascending=False)
-             .head(20)
-             .rename(columns={title_col: "title", "_runtime_min": "runtime_min"}))
+    minutes = _to_minutes(df[runtime_col])
+    pos = minutes.reset_index(drop=True).dropna().nlargest(20).index
+    res = pd.DataFrame({"title": df[title_col].iloc[pos], "runtime_min": minutes.iloc[pos]})
     return res, runtime_col, title_col
 
 # ----------------- Q5/Q6: Gross (revenue) & Budget tops/bottoms -----------------
-def _top_n_by_metric(df: pd.DataFrame, patterns: List[str], n: int, smallest: bool = False):
-    title_col = _title_col(df)
-    metric_col = _find_col(df, patterns)
+def _top_n_by_metric(df: pd.DataFrame, key: str, n: int, smallest: bool = False, cols: Optional[Dict] = None):
+    cols = _detect_columns(df) if cols is None else cols
+    title_col, metric_col = cols["title"], cols[key]
     if metric_col is None:
         return pd.DataFrame(columns=[title_col, "value"]), None, title_col
     v = _to_numeric(df[metric_col])
-    res = (df.assign(_val=v)[[title_col, "_val"]]
-             .dropna(subset=["_val"])
-             .sort_values("_val", ascending=smallest)
-             .head(n)
-             .rename(columns={title_col: "title", "_val": "value"}))
+    arr = v.to_numpy(dtype=float, na_value=np.nan)
+    pos = np.flatnonzero(~np.isnan(arr))
+    sort_key = arr[pos] if smallest else -arr[pos]
+    # O(N) selection of the n extremes, then sort only those n
+    part = np.argpartition(sort_key, n)[:n] if len(sort_key) > n else np.arange(len(sort_key))
+    idx = pos[part[np.argsort(sort_key[part], kind="stable")]]
+    res = pd.DataFrame({"title": df[title_col].iloc[idx], "value": v.iloc[idx]})
     return res, metric_col, title_col
 
-def top5_gross_highest(df: pd.DataFrame):
-    return _top_n_by_metric(df, [r"\bgross\b", r"revenue", r"box.?office", r"world.*gross", r"domestic.*gross"], 5, smallest=False)
+def top5_gross_highest(df: pd.DataFrame, cols: Optional[Dict] = None):
+    return _top_n_by_metric(df, "gross", 5, smallest=False, cols=cols)
 
-def top5_gross_lowest(df: pd.DataFrame):
-    return _top_n_by_metric(df, [r"\bgross\b", r"revenue", r"box.?office", r"world.*gross", r"domestic.*gross"], 5, smallest=True)
+def top5_gross_lowest(df: pd.DataFrame, cols: Optional[Dict] = None):
+    return _top_n_by_metric(df, "gross", 5, smallest=True, cols=cols)
 
-def top3_budget_highest(df: pd.DataFrame):
-    return _top_n_by_metric(df, [r"\bbudget\b", r"production.*budget", r"cost"], 3, smallest=False)
+def top3_budget_highest(df: pd.DataFrame, cols: Optional[Dict] = None):
+    return _top_n_by_metric(df, "budget", 3, smallest=False, cols=cols)
 
-def top3_budget_lowest(df: pd.DataFrame):
-    return _top_n_by_metric(df, [r"\bbudget\b", r"production.*budget", r"cost"], 3, smallest=True)
+def top3_budget_lowest(df: pd.DataFrame, cols: Optional[Dict] = None):
+    return _top_n_by_metric(df, "budget", 3, smallest=True, cols=cols)
 
 # ----------------- Q7/Q8: Release year with most/least movies -----------------
-def release_year_extrema(df: pd.DataFrame):
-    year_col = _find_col(df, [r"\btitle[_\s]?year\b", r"release.*year", r"\byear\b"])
+def release_year_extrema(df: pd.DataFrame, cols: Optional[Dict] = None):
+    year_col = (_detect_columns(df) if cols is None else cols)["year"]
     if year_col is None:
         return None, None, None, None, None
-    years = _to_numeric(df[year_col]).dropna().astype(int)
-    if years.empty:
+    years = _to_numeric(df[year_col]).dropna().to_numpy().astype(np.int64)
+    if years.size == 0:
         return None, None, None, None, year_col
-    counts = years.value_counts().sort_index()  # counts per year
-    most_year = int(counts.idxmax())
-    most_count = int(counts.max())
-    least_year = int(counts.idxmin())
-    least_count = int(counts.min())
+    # years span a small dense range: count them with one bincount pass, no hashing
+    ymin = years.min()
+    counts = np.bincount(years - ymin)  # counts per year offset
+    most_off = int(counts.argmax())
+    seen = np.flatnonzero(counts)
+    least_off = int(seen[counts[seen].argmin()])
+    most_year = int(ymin + most_off)
+    most_count = int(counts[most_off])
+    least_year = int(ymin + least_off)
+    least_count = int(counts[least_off])
     return most_year, most_count, least_year, least_count, year_col
 
 # ----------------- Q9: Top five best-reputation directors -----------------
-def best_reputation_directors(df: pd.DataFrame, top: int = 5, min_movies: int = 3):
-    director_col = _find_col(df, [r"director"])
-    rating_col = _find_col(df, [r"imdb.*score", r"\brating\b", r"\bscore\b", r"metascore", r"metacritic", r"tomato.*meter"])
+def best_reputation_directors(df: pd.DataFrame, top: int = 5, min_movies: int = 3, cols: Optional[Dict] = None):
+    cols = _detect_columns(df) if cols is None else cols
+    director_col, rating_col = cols["director"], cols["rating"]
     if director_col is None or rating_col is None:
         return pd.DataFrame(columns=["director", "avg_rating", "movies"]), director_col, rating_col
 
     ratings = _to_numeric(df[rating_col])
-    grp = (df.assign(_rating=ratings)
-             .dropna(subset=["_rating"])
-             .groupby(director_col)["_rating"]
-             .agg(avg_rating="mean", movies="count")
-             .reset_index()
-             .rename(columns={director_col: "director"}))
+    # count() skips NaN ratings, so no dropna copy is needed; sort=False skips the key sort
+    grp = (ratings.groupby(df[director_col], sort=False, observed=True)
+                  .agg(avg_rating="mean", movies="count")
+                  .rename_axis("director")
+                  .reset_index())
 
     # Require a reasonable body of work; relax if needed
-    cur_min = min_movies
-    while cur_min >= 1:
-        subset = grp[grp["movies"] >= cur_min]
-        if len(subset) >= top or cur_min == 1:
-            break
+    movies = grp["movies"].to_numpy()
+    cur_min = max(min_movies, 1)
+    while cur_min > 1 and np.count_nonzero(movies >= cur_min) < top:
         cur_min -= 1
 
-    res = subset.sort_values(["avg_rating", "movies"], ascending=[False, False]).head(top)
+    res = (grp[movies >= cur_min]
+              .sort_values(["avg_rating", "movies", "director"], ascending=[False, False, True])
+              .head(top))
     return res, director_col, rating_col
 
 # ----------------- Q10: Actor rankings (performances, social influence, best movie) -----------------
-def actor_rankings(df: pd.DataFrame, top: int = 10):
-    title_col = _title_col(df)
-    rating_col = _find_col(df, [r"imdb.*score", r"\brating\b", r"\bscore\b"])
+def _actor_columns(df: pd.DataFrame) -> Tuple[List[str], List[Optional[str]]]:
+    """Return (actor name columns, matching facebook-likes column or None for each)."""
     # find actor name columns
-    name_cols = [c for c in df.columns if re.search(r"\bactor.*name\b|\bstar.*name\b|\bcast.*name\b", str(c), re.I)]
+    name_cols = [c for c in df.columns if _ACTOR_NAME_RE.search(str(c))]
     if not name_cols:
         # Kaggle-style fallback
         for i in (1, 2, 3):
             c = f"actor_{i}_name"
             if c in df.columns:
                 name_cols.append(c)
-    frames = []
+    likes_cols = []
     for c in name_cols:
         # try to find a corresponding facebook likes column
         likes_col = None
-        m = re.search(r"actor[_\s]*([0-9]+).*name", str(c), re.I)
+        m = _ACTOR_SLOT_RE.search(str(c))
         if m:
             guess = f"actor_{m.group(1)}_facebook_likes"
             if guess in df.columns:
                 likes_col = guess
         if likes_col is None:
             # best-effort generic lookup
-            likes_candidates = [col for col in df.columns if re.search(r"facebook.*likes", str(col), re.I) and m and m.group(1) in str(col)]
+            likes_candidates = [col for col in df.columns if _LIKES_RE.search(str(col)) and m and m.group(1) in str(col)]
             likes_col = likes_candidates[0] if likes_candidates else None
+        likes_cols.append(likes_col)
 
-        sub = pd.DataFrame({
-            "actor_name": df[c].astype(str),
-            "actor_facebook_likes": _to_numeric(df[likes_col]) if likes_col else np.nan,
-            "title": df[title_col].astype(str),
-            "rating": _to_numeric(df[rating_col]) if rating_col else np.nan,
-        })
-        frames.append(sub)
+    return name_cols, likes_cols
 
-    if not frames:
+def _actor_codes(df: pd.DataFrame, name_cols: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return slot-major codes for every (actor slot, movie) pair and the sorted names they index.
+
+    Each slot is factorized on its own dtype (category columns reuse their codes); str() and the
+    blank check run once per distinct value. Missing and blank names get code -1."""
+    slot_codes, labels = [], []
+    for c in name_cols:
+        s = df[c]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            codes, uniques = s.cat.codes.to_numpy(), s.cat.categories
+        else:
+            codes, uniques = pd.factorize(s)
+        slot_codes.append(codes)
+        labels.append(np.asarray(uniques.astype(object)).astype(str).astype(object))
+    # one name table for all slots, sorted the way a groupby on the names would sort them
+    remap, names = pd.factorize(np.concatenate(labels), sort=True)
+    names = np.asarray(names, dtype=object)
+    blank = pd.Index(names).str.strip().to_numpy() == ""
+    remap = np.where(blank[remap], -1, remap)
+    out, offset = [], 0
+    for codes, uniq in zip(slot_codes, labels):
+        # a trailing -1 slot catches the missing (-1) codes
+        lookup = np.append(remap[offset:offset + len(uniq)], -1)
+        out.append(lookup[codes])
+        offset += len(uniq)
+    return np.concatenate(out), names
+
+def actor_rankings(df: pd.DataFrame, top: int = 10, cols: Optional[Dict] = None):
+    cols = _detect_columns(df) if cols is None else cols
+    title_col, rating_col = cols["title"], cols["actor_rating"]
+    name_cols, likes_cols = cols["actors"], cols["actor_likes"]
+
+    if not name_cols:
         # nothing found
         empty = pd.DataFrame(columns=["actor_name"])
         return empty, empty, empty, name_cols, rating_col
 
-    actors = pd.concat(frames, ignore_index=True)
-    actors = actors[actors["actor_name"].notna() & (actors["actor_name"].str.strip() != "")]
-
-    # a) by number of movies
-    by_perf = (actors.groupby("actor_name").size()
-                      .sort_values(ascending=False)
-                      .reset_index(name="movie_count")
-                      .head(top))
-
-    # b) by social media influence (max fb likes observed)
-    if actors["actor_facebook_likes"].notna().any():
-        by_social = (actors.groupby("actor_name")["actor_facebook_likes"]
-                            .max()
-                            .sort_values(ascending=False)
-                            .reset_index(name="max_facebook_likes")
-                            .head(top))
+    # long form on integer codes: one entry per (actor slot, movie), slot-major
+    n = len(df)
+    codes, names = _actor_codes(df, name_cols)
+    likes = np.column_stack([
+        _to_numeric(df[c]).to_numpy(dtype=float, na_value=np.nan) if c else np.full(n, np.nan) for c in likes_cols
+    ]).ravel(order="F")
+    rows = np.flatnonzero(codes >= 0)
+    codes, likes = codes[rows], likes[rows]
+
+    # a) + b) on the codes: number of movies and max fb likes observed; codes follow name order
+    movie_count = np.bincount(codes, minlength=len(names))
+    max_likes = pd.Series(likes).groupby(codes).max().reindex(range(len(names)))
+    seen = movie_count > 0
+    stats = pd.DataFrame(
+        {"movie_count": movie_count[seen], "max_facebook_likes": max_likes.to_numpy()[seen]},
+        index=pd.Index(names[seen], name="actor_name"),
+    )
+    by_perf = (stats["movie_count"]
+                    .sort_values(ascending=False, kind="stable")
+                    .head(top)
+                    .reset_index())
+
+    if stats["max_facebook_likes"].notna().any():
+        by_social = (stats["max_facebook_likes"]
+                          .sort_values(ascending=False, kind="stable")
+                          .head(top)
+                          .reset_index())
     else:
         by_social = pd.DataFrame(columns=["actor_name", "max_facebook_likes"])
 
     # c) by best movie (highest rating)
-    if "rating" in actors and actors["rating"].notna().any():
-        sub = actors.dropna(subset=["rating"])
-        idx = sub.groupby("actor_name")["rating"].idxmax()
-        best = (sub.loc[idx, ["actor_name", "title", "rating"]]
-                    .rename(columns={"title": "best_movie", "rating": "best_rating"})
-                    .sort_values(["best_rating", "actor_name"], ascending=[False, True])
-                    .head(top))
+    rating = _to_numeric(df[rating_col]).to_numpy(dtype=float, na_value=np.nan)[rows % n] if rating_col else None
+    if rating is not None and not np.isnan(rating).all():
+        rated = ~np.isnan(rating)
+        r_rows, r_codes, r_rating = rows[rated], codes[rated], rating[rated]
+        # one stable sort + first per code keeps each actor's first top-rated movie (same pick as idxmax)
+        order = np.lexsort((r_codes, -r_rating))
+        first = order[~pd.Series(r_codes[order]).duplicated().to_numpy()][:top]
+        best = pd.DataFrame({
+            "actor_name": names[r_codes[first]],
+            "best_movie": df[title_col].iloc[r_rows[first] % n].astype(str).to_numpy(),
+            "best_rating": r_rating[first],
+        })
     else:
         best = pd.DataFrame(columns=["actor_name", "best_movie", "best_rating"])
 
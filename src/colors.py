@@ -0,0 +1,37 @@
+import re
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+COLOR_LABELS = ["Black & White", "Color", "Unknown"]
+# "black" and "white" in either order, the usual abbreviations, or monochrome wording;
+# kept RE2-compatible (no lookarounds) so Arrow's regex kernel can run it
+BW_RE = re.compile(r"black.*white|white.*black|b&w|b/w|mono|gr[ae]yscale|^bw$")
+COLOR_RE = re.compile(r"colou?r")
+
+
+def _is_arrow_string(dtype) -> bool:
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+
+
+def standardize_colors(df: pd.DataFrame, col: str) -> pd.Series:
+    """
+    Map raw color values to "Black & White" / "Color" / "Unknown" with Arrow compute kernels;
+    the result is categorical so value_counts is a bincount over the codes.
+    """
+    # Arrow-backed strings go straight to the kernels; columns loaded by load_movies already are, so no copy
+    s = df[col]
+    if not _is_arrow_string(s.dtype):
+        s = s.astype("string[pyarrow]")
+    # one trimmed, lowercased buffer feeds both regex passes; missing values match nothing
+    a = pc.utf8_lower(pc.utf8_trim_whitespace(s.array.__arrow_array__()))
+    bw = pc.fill_null(pc.match_substring_regex(a, BW_RE.pattern), False)
+    color = pc.fill_null(pc.match_substring_regex(a, COLOR_RE.pattern), False)
+    # codes index COLOR_LABELS; "", "nan", "none", "null" match neither pattern and end up Unknown
+    codes = pc.case_when(pc.make_struct(bw, color), pa.scalar(0, pa.int8()), pa.scalar(1, pa.int8()),
+                         pa.scalar(2, pa.int8()))
+    labels = pd.Categorical.from_codes(codes.to_numpy(), categories=COLOR_LABELS)
+    return pd.Series(labels, index=s.index, name=col)
@@ -1,21 +1,82 @@
+import codecs
+import hashlib
+import io
+import os
 import re
+import shutil
 import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, Optional, Dict
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
+import charset_normalizer
 import gdown
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.feather as pa_feather
+import pyarrow.json as pa_json
+import pyarrow.parquet as pq
+import requests
 
-from .config import GOOGLE_FILE_ID, RAW_DIR
+from .colors import COLOR_LABELS, standardize_colors
+from .config import GOOGLE_FILE_ID, PROCESSED_DIR, RAW_DIR
+
+DRIVE_URL = "https://drive.usercontent.google.com/download"
+
+# column names that look like a color / black & white indicator
+_COLOR_COL_RE = re.compile(r"color|b(?:lack)?.*white|b&w", re.I)
+# below this many rows a sequential non-null count is cheaper than starting a thread pool
+_PARALLEL_COUNT_ROWS = 1_000_000
+
+
+def _drive_download(file_id: str, out_dir: Path) -> Optional[Path]:
+    """
+    Stream a public Drive file into out_dir in 1 MiB chunks, resuming a leftover .part file.
+    Returns None when Drive answers with an HTML page (confirm-token or permission flow).
+    """
+    params = {"id": file_id, "export": "download"}
+    with requests.Session() as session:
+        resp = session.get(DRIVE_URL, params=params, stream=True, timeout=60)
+        resp.raise_for_status()
+        if resp.headers.get("Content-Type", "").startswith("text/html"):
+            resp.close()
+            return None
+        m = re.search(r'filename="?([^";]+)"?', resp.headers.get("Content-Disposition", ""))
+        out_path = Path(out_dir) / (Path(m.group(1)).name if m else file_id)
+        part = out_path.with_name(out_path.name + ".part")
+        done = part.stat().st_size if part.exists() else 0
+        if done and resp.headers.get("Accept-Ranges") == "bytes":
+            resp.close()
+            resp = session.get(DRIVE_URL, params=params, stream=True, timeout=60,
+                               headers={"Range": f"bytes={done}-"})
+            resp.raise_for_status()
+        with resp:
+            # 206 means the server honoured the Range header; anything else restarts the file
+            mode = "ab" if resp.status_code == 206 else "wb"
+            with open(part, mode, buffering=1 << 20) as f:
+                for chunk in resp.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+    part.replace(out_path)
+    return out_path
 
 
 def download_data(file_id: str = GOOGLE_FILE_ID, out_dir: Path = RAW_DIR) -> Path:
     """
     Downloads a file (or folder/zip) from Google Drive by ID into out_dir.
+    Streams it directly when Drive serves the file, otherwise falls back to gdown.
     Returns the path to the downloaded item.
     """
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        downloaded = _drive_download(file_id, out_dir)
+    except requests.RequestException:
+        downloaded = None
+    if downloaded is not None:
+        return downloaded
     # Let gdown decide filename; returns the downloaded file path.
     downloaded_path = gdown.download(id=file_id, output=str(out_dir), quiet=False, fuzzy=True)
     if downloaded_path is None:
@@ -23,21 +84,221 @@ def download_data(file_id: str = GOOGLE_FILE_ID, out_dir: Path = RAW_DIR) -> Pat
     return Path(downloaded_path)
 
 
+TABLE_EXTS = (".csv", ".tsv", ".xlsx", ".xls", ".parquet", ".json")
+
+
+def _pick_table_entry(names: List[str]) -> Optional[str]:
+    """
+    First zip entry of the most preferred extension in TABLE_EXTS, or None.
+    """
+    priority = {ext: i for i, ext in enumerate(TABLE_EXTS)}
+    ranked = [(priority[Path(n).suffix.lower()], i) for i, n in enumerate(names)
+              if not n.endswith("/") and Path(n).suffix.lower() in priority]
+    return names[min(ranked)[1]] if ranked else None
+
+
+def _read_zipped_table(zip_path: Path, usecols: Optional[List[str]] = None) -> Optional[Tuple[pd.DataFrame, Path]]:
+    """
+    Read the preferred table entry of a zip straight from the archive when it is a CSV or Parquet file.
+    Returns (dataframe, zip_path): the archive itself is the path to pass back to load_movies or
+    count_bw_color, since an entry inside it has no path of its own. Returns None for other
+    formats (or when the pyarrow CSV parse fails or meets non-UTF-8 text) so the caller extracts
+    instead.
+    """
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        entry = _pick_table_entry(zf.namelist())
+        if entry is None:
+            return None
+        ext = Path(entry).suffix.lower()
+        try:
+            if ext == ".csv":
+                with zf.open(entry) as raw, io.BufferedReader(raw, buffer_size=1 << 20) as f:
+                    df = pd.read_csv(f, engine="pyarrow", usecols=usecols, dtype_backend="pyarrow")
+                if _has_binary_columns(df):
+                    return None  # not UTF-8: extract it so _read_delimited can detect the encoding
+            elif ext == ".parquet":
+                df = pq.read_table(io.BytesIO(zf.read(entry)), columns=usecols).to_pandas()
+            else:
+                return None
+        except (ImportError, ValueError):
+            return None
+    return df, Path(zip_path)
+
+
 def _find_first_table_file(dirpath: Path) -> Optional[Path]:
-    exts = (".csv", ".tsv", ".xlsx", ".xls", ".parquet", ".json")
-    for ext in exts:
-        files = list(Path(dirpath).glob(f"**/*{ext}"))
-        if files:
-            return files[0]
-    return None
+    """
+    Single directory walk returning the first file of the most preferred extension in TABLE_EXTS;
+    stops as soon as a CSV is seen.
+    """
+    priority = {ext: i for i, ext in enumerate(TABLE_EXTS)}
+    best: Optional[Tuple[int, Path]] = None
+    for root, _, files in os.walk(dirpath):
+        for f in files:
+            rank = priority.get(os.path.splitext(f)[1].lower())
+            if rank is None or (best is not None and rank >= best[0]):
+                continue
+            best = (rank, Path(root) / f)
+            if rank == 0:
+                return best[1]
+    return best[1] if best else None
+
+
+def _extract_tables(zip_path: Path, out_dir: Path) -> None:
+    """
+    Extract only the table-like entries of a zip into out_dir, copying through 1 MiB buffers.
+    """
+    out_dir = Path(out_dir).resolve()
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        for info in zf.infolist():
+            if info.is_dir() or Path(info.filename).suffix.lower() not in TABLE_EXTS:
+                continue
+            target = (out_dir / info.filename).resolve()
+            if out_dir not in target.parents:
+                continue  # skip entries that would land outside out_dir
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(info) as raw, io.BufferedReader(raw, buffer_size=1 << 20) as src, \
+                    open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, length=1 << 20)
+
+
+def _detect_encoding(p: Path) -> str:
+    """
+    Best guess at a text file's encoding from its first 64 KiB (UTF-8 when undecided).
+    """
+    with open(p, "rb") as f:
+        best = charset_normalizer.from_bytes(f.read(1 << 16)).best()
+    return best.encoding if best is not None else "utf-8"
 
 
-def load_movies(downloaded_path: Path) -> Tuple[pd.DataFrame, Path]:
+def _has_binary_columns(data: Union[pd.DataFrame, pa.Table]) -> bool:
+    """
+    True when pyarrow read some text column as binary, i.e. it was not valid in the encoding used.
+    """
+    if isinstance(data, pa.Table):
+        types = data.schema.types
+    else:
+        types = [t.pyarrow_dtype for t in data.dtypes if isinstance(t, pd.ArrowDtype)]
+    return any(pa.types.is_binary(t) or pa.types.is_large_binary(t) for t in types)
+
+
+def _read_delimited(p: Path, sep: str = ",", encoding: str = "utf-8", **hints) -> pd.DataFrame:
+    """
+    Parse a CSV/TSV with the multithreaded pyarrow engine into Arrow-backed columns.
+    Falls back to the C engine when pyarrow is missing or rejects the file (or nrows is given,
+    which pyarrow cannot do); text that is not in the given encoding is re-read once with the
+    detected one. hints are read_csv's usecols/dtype/nrows.
+    """
+    err = None
+    try:
+        if hints.get("nrows") is not None:
+            raise ValueError("nrows needs the C engine")
+        df = pd.read_csv(p, sep=sep, engine="pyarrow", encoding=encoding, dtype_backend="pyarrow", **hints)
+    except (ImportError, ValueError):  # ParserError and ArrowInvalid are ValueErrors
+        try:
+            df = pd.read_csv(p, sep=sep, encoding=encoding, low_memory=False, dtype_backend="pyarrow", **hints)
+        except UnicodeDecodeError as e:
+            df, err = None, e
+    # undecodable text makes the C engine raise, while pyarrow hands it back as binary columns
+    if df is not None and not _has_binary_columns(df):
+        return df
+    detected = _detect_encoding(p)
+    if codecs.lookup(detected).name != codecs.lookup(encoding).name:
+        return _read_delimited(p, sep, detected, **hints)
+    if err is not None:
+        raise err
+    return df
+
+
+def _read_json(p: Path) -> pd.DataFrame:
+    """
+    NDJSON goes through Arrow's multithreaded block parser. What it rejects (or reads as a single
+    row of objects) is a JSON document for pd.read_json, else NDJSON with mixed-type rows.
+    """
+    try:
+        tbl = pa_json.read_json(p)
+    except pa.ArrowInvalid:
+        tbl = None
+    if tbl is not None and not (tbl.num_rows == 1 and all(pa.types.is_struct(t) for t in tbl.schema.types)):
+        return tbl.to_pandas(types_mapper=pd.ArrowDtype)
+    try:
+        return pd.read_json(p)
+    except ValueError:
+        return pd.read_json(p, lines=True)
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def _derived_path(src: Path, tail: str) -> Path:
+    """
+    "<stem>.<source id>.<version><tail>" in PROCESSED_DIR. The source id hashes the resolved path,
+    so every source file has its own group; the version hashes (mtime_ns, size), so any change
+    to the source misses.
+    """
+    st = src.stat()
+    version = _digest(f"{st.st_mtime_ns}:{st.st_size}")
+    return PROCESSED_DIR / f"{src.stem}.{_digest(str(src.resolve()))}.{version}{tail}"
+
+
+def _parquet_cache_path(src: Path) -> Path:
+    """
+    Cache file for a parsed text table; see _derived_path for the naming.
+    """
+    return _derived_path(src, ".parquet")
+
+
+def _drop_stale_versions(current: Path, tail: str) -> None:
+    """
+    Remove the other versions of current's source file, matched on the source id only.
+    """
+    source_id = current.name[: -len(tail)].rsplit(".", 2)[1]
+    for old in current.parent.glob(f"*.{source_id}.*{tail}"):
+        if old != current:
+            old.unlink(missing_ok=True)
+
+
+def _replace_atomically(target: Path, write: Callable[[Path], None]) -> None:
+    """
+    Run write() on a temp file next to target and move it into place, so no reader (or
+    interrupted run) ever leaves a partial target behind. The temp file is removed on failure.
+    """
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp)
+        tmp.replace(target)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _write_parquet_cache(df: pd.DataFrame, cache: Path) -> None:
+    """
+    Persist a parsed text table as zstd Parquet so the next run skips CSV parsing.
+    Columns Arrow cannot type (mixed objects) just mean no cache this time.
+    """
+    try:
+        _replace_atomically(cache, lambda tmp: df.to_parquet(tmp, engine="pyarrow", compression="zstd"))
+    except (OSError, ValueError, TypeError):
+        return
+    _drop_stale_versions(cache, ".parquet")
+
+
+def load_movies(
+    downloaded_path: Path,
+    usecols: Optional[List[str]] = None,
+    dtype=None,
+    nrows: Optional[int] = None,
+) -> Tuple[pd.DataFrame, Path]:
     """
     Given a path returned by download_data, locate a tabular file and load it.
-    Supports CSV/TSV/XLS/XLSX/Parquet/JSON and ZIPs containing those.
-    Returns (dataframe, actual_table_file_path).
+    Supports CSV/TSV/XLS/XLSX/Parquet/JSON and ZIPs containing those (CSV/Parquet are read in memory).
+    CSV/TSV parses are cached as Parquet in PROCESSED_DIR, keyed by the source's path, mtime and size.
+    usecols (column names), dtype and nrows are forwarded to the readers that support them and
+    applied afterwards for the rest; only full CSV/TSV reads are written to the cache.
+    Returns (dataframe, actual_table_file_path); for a CSV/Parquet read straight from a zip that
+    path is the zip itself, which load_movies and count_bw_color both accept.
     """
+    hints = {"usecols": usecols, "dtype": dtype, "nrows": nrows}
     p = Path(downloaded_path)
 
     if p.is_dir():
@@ -47,8 +308,11 @@ def load_movies(downloaded_path: Path) -> Tuple[pd.DataFrame, Path]:
         p = table
 
     elif p.suffix.lower() == ".zip":
-        with zipfile.ZipFile(p, "r") as zf:
-            zf.extractall(p.parent)
+        # CSV/Parquet entries are parsed from the archive stream; anything else is extracted first
+        loaded = _read_zipped_table(p, usecols)
+        if loaded is not None:
+            return _apply_load_hints(loaded[0], **hints), loaded[1]
+        _extract_tables(p, p.parent)
         table = _find_first_table_file(p.parent)
         if table is None:
             raise FileNotFoundError("Zip extracted but no table-like file found.")
@@ -56,76 +320,233 @@ def load_movies(downloaded_path: Path) -> Tuple[pd.DataFrame, Path]:
 
     # Read based on extension
     suf = p.suffix.lower()
+    if suf in (".csv", ".tsv"):
+        cache = _parquet_cache_path(p)
+        if cache.exists():
+            try:
+                df = pd.read_parquet(cache, engine="pyarrow", columns=usecols, dtype_backend="pyarrow")
+            except (OSError, pa.ArrowException):
+                cache.unlink(missing_ok=True)  # damaged cache: drop it and parse the source again
+            else:
+                return _apply_load_hints(df, **hints), p
+
     if suf == ".csv":
         try:
-            df = pd.read_csv(p, low_memory=False)
+            df = _read_delimited(p, **hints)
         except Exception:
-            df = pd.read_csv(p, sep=None, engine="python", low_memory=False)
+            # separator sniffing is the slow last resort, not the answer to encoding errors
+            df = pd.read_csv(p, sep=None, engine="python", encoding=_detect_encoding(p), dtype_backend="pyarrow",
+                             **hints)
     elif suf == ".tsv":
-        df = pd.read_csv(p, sep="\t", low_memory=False)
+        df = _read_delimited(p, sep="\t", **hints)
     elif suf in (".xlsx", ".xls"):
-        df = pd.read_excel(p)
+        df = pd.read_excel(p, **hints)
     elif suf == ".parquet":
-        df = pd.read_parquet(p)
+        df = pd.read_parquet(p, engine="pyarrow", columns=usecols)
     elif suf == ".json":
-        try:
-            df = pd.read_json(p, lines=True)
-        except ValueError:
-            df = pd.read_json(p)
+        df = _read_json(p)
     else:
         raise ValueError(f"Unsupported file type: {suf}")
 
-    return df, p
+    if suf in (".csv", ".tsv") and all(v is None for v in hints.values()):
+        _write_parquet_cache(df, cache)
+    return _apply_load_hints(df, **hints), p
+
+
+def _apply_load_hints(df: pd.DataFrame, usecols=None, dtype=None, nrows=None) -> pd.DataFrame:
+    """
+    Apply load_movies' usecols/dtype/nrows to a frame whose reader could not push them down
+    (a no-op for those it already shaped). Columns come back in usecols order.
+    """
+    if usecols is not None:
+        df = df[list(usecols)]
+    if nrows is not None:
+        df = df.head(nrows)
+    if isinstance(dtype, dict):
+        dtype = {c: t for c, t in dtype.items() if c in df.columns}
+    if dtype:
+        df = df.astype(dtype)
+    return df
+
+
+def _color_candidates(names) -> List[str]:
+    """
+    Column names that look like a movie color vs black & white indicator.
+    """
+    return [c for c in names if _COLOR_COL_RE.search(str(c))]
+
+
+def _non_null_count(s: pd.Series) -> int:
+    """
+    Non-null values in s; Arrow-backed columns already carry their null count.
+    """
+    if isinstance(s.dtype, pd.ArrowDtype):
+        return len(s) - s.array.__arrow_array__().null_count
+    return int(s.count())
 
 
 def _infer_color_column(df: pd.DataFrame) -> Optional[str]:
     """
     Heuristically pick a column that indicates movie color vs black & white.
     """
-    candidates = [c for c in df.columns if re.search(r"color|b(?:lack)?.*white|b&w", str(c), re.I)]
+    candidates = _color_candidates(df.columns)
     if not candidates:
         return None
-    # prefer column with most non-null values
-    best = max(candidates, key=lambda c: df[c].notna().sum())
+    # prefer column with most non-null values; Arrow columns answer from metadata, the others
+    # need a full scan, which runs concurrently (count releases the GIL) on big frames
+    scan = [c for c in candidates if not isinstance(df[c].dtype, pd.ArrowDtype)]
+    if len(scan) > 1 and len(df) >= _PARALLEL_COUNT_ROWS:
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as ex:
+            counts = list(ex.map(lambda c: _non_null_count(df[c]), candidates))
+    else:
+        counts = [_non_null_count(df[c]) for c in candidates]
+    best = candidates[counts.index(max(counts))]
     return best
 
 
-def _standardize_color_series(df: pd.DataFrame, col: str) -> pd.Series:
-    s = df[col].astype(str).str.strip().str.lower()
+def read_color_column(path: Path) -> Optional[pd.Series]:
+    """
+    Read just the color column of a CSV. The header is peeked with pyarrow's streaming reader,
+    only the color-like columns are parsed, and only the chosen one is converted to pandas.
+    Returns None when no column looks like a color indicator; raises ArrowInvalid when the
+    candidates are not UTF-8 text.
+    """
+    with pa_csv.open_csv(path) as reader:
+        candidates = _color_candidates(reader.schema.names)
+    if not candidates:
+        return None
+    convert = pa_csv.ConvertOptions(include_columns=candidates, strings_can_be_null=True)
+    table = pa_csv.read_csv(path, convert_options=convert)
+    if _has_binary_columns(table):
+        raise pa.ArrowInvalid(f"{path}: color columns are not valid UTF-8")
+    # prefer column with most non-null values, as _infer_color_column does
+    col = max(candidates, key=lambda c: -table.column(c).null_count)
+    return table.column(col).to_pandas(types_mapper=pd.ArrowDtype).rename(col)
+
+
+def _color_counts(mapped: pd.Series) -> Dict[str, int]:
+    """
+    Counts per COLOR_LABELS entry, as a bincount over the categorical codes.
+    """
+    counts = np.bincount(mapped.cat.codes.to_numpy(), minlength=len(COLOR_LABELS))
+    return {k: int(n) for k, n in zip(COLOR_LABELS, counts)}
+
+
+def _load_color_candidates(path: Path) -> pd.DataFrame:
+    """
+    Load only the color-like columns of a table. For Parquet the candidates are picked from
+    the schema alone, so no other column is ever decoded; CSVs go through read_color_column.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        try:
+            s = read_color_column(path)
+        except (pa.ArrowInvalid, OSError):
+            s = None  # let the regular loader and its fallbacks deal with it
+        if s is not None:
+            return s.to_frame()
+    if path.suffix.lower() != ".parquet":
+        df, _ = load_movies(path)
+        return df[_color_candidates(df.columns)]
+    pf = pq.ParquetFile(path)
+    candidates = _color_candidates(pf.schema_arrow.names)
+    if not candidates:
+        return pd.DataFrame(index=pd.RangeIndex(pf.metadata.num_rows))
+    df, _ = load_movies(path, usecols=candidates)
+    return df
+
+
+def _color_sidecar_path(src: Path) -> Path:
+    return _derived_path(src, ".color.feather")
 
-    def map_value(x: str) -> str:
-        if x in ("", "nan", "none", "null"):
-            return "Unknown"
-        if "black" in x and "white" in x:
-            return "Black & White"
-        if "b&w" in x or "b/w" in x:
-            return "Black & White"
-        if "mono" in x or "grayscale" in x or "greyscale" in x:
-            return "Black & White"
-        if "color" in x or "colour" in x or "colorized" in x:
-            return "Color"
-        # fallbacks
-        if x == "bw":
-            return "Black & White"
-        return "Unknown"
 
-    return s.map(map_value)
+def _read_color_sidecar(sidecar: Path) -> Optional[Tuple[pd.Series, str]]:
+    """
+    (standardized colors, source column) from a sidecar; None, with the file removed, when it is damaged.
+    """
+    try:
+        tbl = pa_feather.read_table(sidecar)
+        mapped = tbl.column("color_norm").to_pandas().astype(pd.CategoricalDtype(COLOR_LABELS))
+        return mapped, tbl.schema.metadata[b"source_column"].decode()
+    except (OSError, pa.ArrowException, KeyError, TypeError):
+        sidecar.unlink(missing_ok=True)
+        return None
+
+
+def _write_color_sidecar(mapped: pd.Series, col: str, sidecar: Path) -> None:
+    """
+    Persist the standardized color categorical (int8 codes + 3-entry dictionary) as zstd Feather,
+    so later count_bw_color calls on the same source skip parsing and classification.
+    """
+    tbl = pa.table({"color_norm": pa.array(mapped.array)}).replace_schema_metadata({"source_column": str(col)})
+    try:
+        _replace_atomically(sidecar, lambda tmp: pa_feather.write_feather(tbl, tmp, compression="zstd"))
+    except OSError:
+        return
+    _drop_stale_versions(sidecar, ".color.feather")
 
 
-def count_bw_color(df: pd.DataFrame) -> Tuple[Dict[str, int], Optional[str]]:
+def count_bw_color(df: Union[pd.DataFrame, Path]) -> Tuple[Dict[str, int], Optional[str]]:
     """
     Return counts for Color vs Black & White (and Unknown), plus the detected column name.
+    df may also be a path to a table, in which case only its color-like columns are loaded and
+    the standardized column is kept as a Feather sidecar in PROCESSED_DIR for the next call.
     """
+    sidecar = None
+    if not isinstance(df, pd.DataFrame):
+        path = Path(df)
+        if path.is_file():
+            sidecar = _color_sidecar_path(path)
+            cached = _read_color_sidecar(sidecar) if sidecar.exists() else None
+            if cached is not None:
+                mapped, col = cached
+                return _color_counts(mapped), col
+        df = _load_color_candidates(path)
     col = _infer_color_column(df)
     if col is None:
         counts = {"Black & White": 0, "Color": 0, "Unknown": len(df)}
         return counts, None
 
-    mapped = _standardize_color_series(df, col)
-    counts = mapped.value_counts(dropna=False).to_dict()
+    mapped = standardize_colors(df, col)
+    if sidecar is not None:
+        _write_color_sidecar(mapped, col, sidecar)
+    counts = _color_counts(mapped)
+    return counts, col
+
+
+def count_bw_color_streaming(
+    path: Path, chunksize: int = 200_000, max_rows: Optional[int] = None, encoding: str = "utf-8"
+) -> Tuple[Dict[str, int], Optional[str]]:
+    """
+    Same result as count_bw_color, computed straight from a CSV without loading the table.
+    Only the color-like columns are parsed, chunk by chunk; stops after max_rows rows if given.
+    Text that is not in the given encoding restarts the count once with the detected one.
+    """
+    try:
+        header = pd.read_csv(path, nrows=0, encoding=encoding).columns
+        candidates = _color_candidates(header)
+        per_col = {c: Counter() for c in candidates}
+        notna = dict.fromkeys(candidates, 0)
+        rows = 0
 
-    # Normalize keys
-    for k in ["Black & White", "Color", "Unknown"]:
-        counts.setdefault(k, 0)
+        # the pyarrow engine has no chunksize support, so stream with the C engine
+        with pd.read_csv(path, usecols=candidates or [0], chunksize=chunksize, nrows=max_rows,
+                         encoding=encoding, low_memory=False) as reader:
+            for chunk in reader:
+                rows += len(chunk)
+                # track every candidate so the final pick matches _infer_color_column on the full file
+                for c in candidates:
+                    notna[c] += _non_null_count(chunk[c])
+                    per_col[c].update(_color_counts(standardize_colors(chunk, c)))
+    except UnicodeDecodeError:
+        # may surface mid-file, so the partial counts are thrown away rather than resumed
+        detected = _detect_encoding(path)
+        if codecs.lookup(detected).name == codecs.lookup(encoding).name:
+            raise
+        return count_bw_color_streaming(path, chunksize, max_rows, detected)
 
+    if not candidates:
+        return {"Black & White": 0, "Color": 0, "Unknown": rows}, None
+    col = max(candidates, key=notna.__getitem__)
+    counts = {k: per_col[col].get(k, 0) for k in COLOR_LABELS}
     return counts, col